@@ -6,21 +6,39 @@ Uses parallel DNS and HTTP checks for speed.
 """
 
 import asyncio
+import ahocorasick
+import aiodns
 import aiohttp
 import ssl
 import certifi
+import codecs
+import collections
+import itertools
 import json
+import multiprocessing
+import lxml.etree
+import lxml.html
+import os
 import re
-import socket
+import sqlite3
+import sys
 from datetime import datetime
 from pathlib import Path
+from html import unescape
 from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+
+from fast_json import load_json, dump_json
 
 DB_FILE = Path(__file__).parent / "molt_sites_db.json"
+SQLITE_FILE = Path(__file__).parent / "molt_sites.db"
 EXCLUDED_JSON = Path(__file__).parent / "excluded_sites.json"
 
+# Enough for the title, parked detection and a few hundred links
+MAX_BODY_BYTES = 512 * 1024
+# Pages advertising more than this in a HEAD response are not worth a GET
+MAX_HEAD_BYTES = 2 * 1024 * 1024
+
 
 def load_lead_sources():
     """Load aggregator sites that should be deep-scraped for leads."""
@@ -34,6 +52,47 @@ def load_lead_sources():
     return {}
 
 
+_session = None
+
+
+def get_session():
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        ssl_ctx = ssl.create_default_context(cafile=certifi.where())
+        conn = aiohttp.TCPConnector(
+            limit=500, limit_per_host=8, ssl=ssl_ctx,
+            ttl_dns_cache=600, use_dns_cache=True, resolver=aiohttp.AsyncResolver(),
+            keepalive_timeout=30, enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(connector=conn)
+    return _session
+
+
+async def close_session():
+    """Close the shared HTTP session at process exit."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+# lxml refuses str input that carries an encoding declaration (XHTML pages)
+_XML_DECL_RE = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+
+def _parse_tree(html):
+    """Parse HTML once with lxml; None if the page cannot be parsed."""
+    try:
+        return lxml.html.fromstring(_XML_DECL_RE.sub('', html, count=1))
+    except:
+        return None
+
+
+# Text nodes a browser would render (script/style/noscript bodies excluded)
+_VISIBLE_TEXT = lxml.etree.XPath('//text()[not(ancestor::script or ancestor::style or ancestor::noscript)]')
+
+
 # All known seeds - comprehensive list from ecosystem mapping
 SEED_URLS = [
     # Index/Directory
@@ -122,6 +181,10 @@ SKIP = {
     'gstatic.com', 'w3.org', 'schema.org', 'apple.com', 'microsoft.com',
 }
 
+# Single-pass substring matchers for SKIP and KEYWORDS
+_SKIP_RE = re.compile('|'.join(re.escape(s) for s in sorted(SKIP, key=len, reverse=True)))
+_KW_RE = re.compile('|'.join(re.escape(k) for k in KEYWORDS))
+
 # Parked domain indicators
 PARKED_INDICATORS = [
     'buy this domain', 'domain is for sale', 'domain for sale',
@@ -131,6 +194,30 @@ PARKED_INDICATORS = [
     'domain available', 'inquire about', 'sponsored listings',
 ]
 
+# One automaton matches every parked indicator in a single pass over the page
+_PARKED_AC = ahocorasick.Automaton()
+for _p in PARKED_INDICATORS:
+    _PARKED_AC.add_word(_p, _p)
+_PARKED_AC.make_automaton()
+
+# Absolute URLs anywhere in the raw page (scripts, inline text, meta tags)
+_URL_RE = re.compile(r'https?://([a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,})')
+
+# Cheap visible-text approximation for is_parked, so most pages skip the DOM
+_HIDDEN_BLOCK_RE = re.compile(r'<(script|style|noscript)\b[^>]*>.*?</\1\s*>', re.I | re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+_TITLE_RE = re.compile(r'<title\b[^>]*>(.*?)</title\s*>', re.I | re.S)
+
+
+def count_parked_indicators(html_lower, limit=2):
+    """Count distinct parked indicators in the page, stopping at limit."""
+    found = set()
+    for _, indicator in _PARKED_AC.iter(html_lower):
+        found.add(indicator)
+        if len(found) >= limit:
+            break
+    return len(found)
+
 # Domain patterns - expanded based on ecosystem mapping
 TLDS = ['com', 'io', 'ai', 'app', 'xyz', 'live', 'world', 'org', 'net', 'co', 'dev', 'bot', 'gg', 'space', 'direct', 'chess', 'town']
 BASES = ['molt', 'claw', 'agent', 'lobster', 'shell', 'bot', 'crab', 'open', 'stark', 'bankr', 'poly']
@@ -138,44 +225,202 @@ SUFFIXES = ['', 's', 'hub', 'net', 'verse', 'world', 'book', 'chan', 'news', 'li
             'overflow', 'arena', 'crunch', 'caster', 'line', 'mates', 'dr', 'launch', 'nch', 'place', 'x', 'direct']
 
 
+# Page analysis lives at module level so it can run in worker processes
+
+def normalize(url):
+    try:
+        p = urlparse(url if '://' in url else f'https://{url}')
+        d = p.netloc.lower()
+        return d[4:] if d.startswith('www.') else d
+    except:
+        return ""
+
+
+def is_parked(html, get_tree=None):
+    if not html or len(html) < 500:
+        return True
+    html_lower = html.lower()
+    parked_count = count_parked_indicators(html_lower)
+    if parked_count >= 2:
+        return True
+    text = ' '.join(_TAG_RE.sub(' ', _HIDDEN_BLOCK_RE.sub(' ', html)).split())
+    if parked_count == 1 and get_tree is not None and len(text) < 400:
+        # Regex stripping is approximate; settle borderline pages on the DOM,
+        # which is only built for them
+        tree = get_tree()
+        if tree is not None:
+            text = visible_text(tree)
+    if len(text) < 200 or len(text.split()) < 30:
+        return True
+    return parked_count >= 1 and len(html) < 5000
+
+
+def visible_text(tree):
+    # Filter script/style text out with XPath rather than dropping those
+    # elements, so the tree stays intact for get_title and extract_domains.
+    try:
+        return ' '.join(s.strip() for s in _VISIBLE_TEXT(tree) if s.strip())
+    except:
+        return ""
+
+
+def get_title(html, tree=None):
+    try:
+        if tree is not None:
+            title = tree.findtext('.//title')
+        else:
+            # No DOM for this page; pull the first <title> straight from the markup
+            m = _TITLE_RE.search(html)
+            title = unescape(m.group(1)) if m else None
+        if title:
+            return title.strip()[:100]
+    except:
+        pass
+    return ""
+
+
+def extract_domains(html, base_url, tree):
+    domains = set()
+    try:
+        for href in tree.xpath('//a/@href | //link/@href'):
+            d = normalize(urljoin(base_url, href))
+            if d:
+                domains.add(d)
+    except:
+        pass
+    for m in _URL_RE.finditer(html):
+        domains.add(m.group(1).lower())
+    return domains
+
+
+def is_html(headers):
+    """True unless the response says it is something other than HTML."""
+    return 'text/html' in headers.get('Content-Type', 'text/html')
+
+
+def analyze(html, base_url, links=False):
+    """Parse one fetched page. Takes and returns only picklable primitives."""
+    # Only link extraction always needs the DOM; otherwise parse lazily for
+    # the borderline is_parked case and read the title with a regex
+    tree = _parse_tree(html) if links else None
+
+    def get_tree():
+        nonlocal tree
+        if tree is None:
+            tree = _parse_tree(html)
+        return tree
+
+    parked = is_parked(html, get_tree)
+    return {
+        "is_parked": parked,
+        "title": get_title(html, tree),
+        "domains": sorted(extract_domains(html, base_url, tree)) if links else [],
+    }
+
+
 class Database:
+    """Site store backed by SQLite (WAL), mirrored to DB_FILE as JSON on save."""
+
+    FIELDS = ("url", "source", "alive", "has_content", "title", "first_seen")
+
     def __init__(self):
         self.path = DB_FILE
-        self.data = self._load()
-
-    def _load(self):
-        if self.path.exists():
+        # One timestamp per crawl run instead of a datetime.now() per new site
+        self._now = datetime.now().isoformat()
+        self.conn = sqlite3.connect(SQLITE_FILE)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS sites (
+                domain TEXT PRIMARY KEY, url TEXT, source TEXT, alive INT,
+                has_content INT, title TEXT, first_seen TEXT
+            )""")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        # DB_FILE stays the shared, tracked copy: pick up any version newer than our last export
+        self._merge_json()
+
+    def _json_mtime(self):
+        try:
+            return self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _merge_json(self):
+        """Upsert DB_FILE into SQLite if it changed since the last export (e.g. after a git pull)."""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = '_json_mtime_ns'").fetchone()
+        mtime = self._json_mtime()
+        if mtime is None:
+            self.conn.execute("INSERT OR IGNORE INTO meta VALUES ('created', ?)",
+                              (json.dumps(datetime.now().isoformat()),))
+        elif row is None or mtime > json.loads(row[0]):
             try:
-                with open(self.path) as f:
-                    return json.load(f)
+                data = load_json(self.path)
             except:
-                pass
-        return {"created": datetime.now().isoformat(), "sites": {}}
+                data = {}
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [(k, json.dumps(v)) for k, v in data.items() if k != "sites"])
+            # Upsert keeps the rowid, so existing sites keep their export order
+            self.conn.executemany(
+                "INSERT INTO sites VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(domain) DO UPDATE SET "
+                "url = excluded.url, source = excluded.source, alive = excluded.alive, "
+                "has_content = excluded.has_content, title = excluded.title, first_seen = excluded.first_seen",
+                [(domain, *(info.get(f) for f in self.FIELDS))
+                 for domain, info in data.get("sites", {}).items()])
+            self._record_json_mtime(mtime)
+        self.conn.commit()
+
+    def _record_json_mtime(self, mtime):
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('_json_mtime_ns', ?)", (json.dumps(mtime),))
 
     def save(self):
-        self.data["last_updated"] = datetime.now().isoformat()
-        with open(self.path, 'w') as f:
-            json.dump(self.data, f, indent=2)
-        real = [d for d, info in self.data["sites"].items() if info.get("has_content")]
-        print(f"\n💾 Saved {len(self.data['sites'])} sites ({len(real)} with real content)")
+        self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_updated', ?)",
+                          (json.dumps(datetime.now().isoformat()),))
+        self.conn.commit()
+        self.export_json()
+        total, real = self.conn.execute("SELECT COUNT(*), SUM(has_content) FROM sites").fetchone()
+        print(f"\n💾 Saved {total} sites ({real or 0} with real content)")
+
+    def _site_info(self, values):
+        """Turn a sites row (minus domain) into its JSON entry; NULL means the key was never set."""
+        info = {f: v for f, v in zip(self.FIELDS, values) if v is not None}
+        for flag in ("alive", "has_content"):
+            if flag in info:
+                info[flag] = bool(info[flag])
+        return info
+
+    def export_json(self):
+        """Write the legacy JSON layout read by sync_portals.py and verify_sites.py."""
+        # Keys starting with '_' are SQLite bookkeeping, not part of the JSON layout
+        data = {k: json.loads(v) for k, v in self.conn.execute("SELECT key, value FROM meta")
+                if not k.startswith('_')}
+        data["sites"] = {}
+        for domain, *values in self.conn.execute("SELECT * FROM sites ORDER BY rowid"):
+            data["sites"][domain] = self._site_info(values)
+        dump_json(self.path, data)
+        self._record_json_mtime(self._json_mtime())
+        self.conn.commit()
 
     def add(self, domain, url, source, alive=True, has_content=False, title=""):
-        is_new = domain not in self.data["sites"]
-        if is_new:
-            self.data["sites"][domain] = {
-                "url": url, "source": source, "alive": alive,
-                "has_content": has_content, "title": title,
-                "first_seen": datetime.now().isoformat(),
-            }
-        else:
-            self.data["sites"][domain]["alive"] = alive
-            self.data["sites"][domain]["has_content"] = has_content
-            if title:
-                self.data["sites"][domain]["title"] = title
+        cur = self.conn.execute(
+            "INSERT OR IGNORE INTO sites VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (domain, url, source, alive, has_content, title, self._now))
+        is_new = cur.rowcount == 1
+        if not is_new:
+            self.conn.execute(
+                "UPDATE sites SET alive = ?, has_content = ?, title = CASE WHEN ? != '' THEN ? ELSE title END "
+                "WHERE domain = ?",
+                (alive, has_content, title, title, domain))
         return is_new
 
+    def get(self, domain):
+        row = self.conn.execute("SELECT * FROM sites WHERE domain = ?", (domain,)).fetchone()
+        if row is None:
+            return {}
+        return self._site_info(row[1:])
+
     def known(self):
-        return set(self.data["sites"].keys())
+        return {d for (d,) in self.conn.execute("SELECT domain FROM sites")}
 
 
 class Crawler:
@@ -183,144 +428,176 @@ class Crawler:
         self.db = db
         self.visited = set()
         self.discoveries = []
-        self.sem = asyncio.Semaphore(500)  # MAX concurrency
-        self.dns_executor = ThreadPoolExecutor(max_workers=200)
-
-    def normalize(self, url):
-        try:
-            p = urlparse(url if '://' in url else f'https://{url}')
-            d = p.netloc.lower()
-            return d[4:] if d.startswith('www.') else d
-        except:
-            return ""
+        self.sem = asyncio.Semaphore(200)  # MAX concurrency
+        # Per-host throttle plus a breaker that stops retrying hosts that keep timing out
+        self.host_sem = collections.defaultdict(lambda: asyncio.Semaphore(4))
+        self.host_fail = collections.Counter()
+        self.no_head = set()  # hosts that reject HEAD; go straight to GET
+        self.dns_sem = asyncio.Semaphore(1000)
+        self.resolver = aiodns.DNSResolver(timeout=2, tries=1, nameservers=['1.1.1.1', '8.8.8.8'])
+        # HTML parsing is CPU-bound; keep it off the event loop
+        self.parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                              mp_context=multiprocessing.get_context('spawn'))
+
+    normalize = staticmethod(normalize)
+
+    def close(self):
+        self.parse_pool.shutdown(cancel_futures=True)
+
+    def claim(self, domain):
+        """Mark domain visited with a single set operation; False if already seen."""
+        before = len(self.visited)
+        self.visited.add(sys.intern(domain))
+        return len(self.visited) != before
 
     def is_interesting(self, domain):
         d = domain.lower()
-        if any(s in d for s in SKIP):
+        if _SKIP_RE.search(d):
             return False
-        return any(k in d for k in KEYWORDS)
-
-    def is_parked(self, html):
-        if not html or len(html) < 500:
-            return True
-        html_lower = html.lower()
-        parked_count = sum(1 for p in PARKED_INDICATORS if p in html_lower)
-        if parked_count >= 2:
-            return True
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            for tag in soup(['script', 'style', 'noscript']):
-                tag.decompose()
-            text = soup.get_text(separator=' ', strip=True)
-            if len(text) < 200 or len(text.split()) < 30:
-                return True
-        except:
-            pass
-        return parked_count >= 1 and len(html) < 5000
+        return _KW_RE.search(d) is not None
 
-    def get_title(self, html):
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            title = soup.find('title')
-            if title:
-                return title.get_text(strip=True)[:100]
-        except:
-            pass
-        return ""
+    async def parse(self, html, url, links=False):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_pool, analyze, html, url, links)
 
     async def fetch(self, session, url):
-        async with self.sem:
+        host = self.normalize(url)
+        async with self.host_sem[host]:
+            if self.host_fail[host] >= 2:
+                return None, False
+            async with self.sem:
+                try:
+                    # Cheap HEAD first so oversized or non-HTML pages are never downloaded
+                    if host not in self.no_head:
+                        try:
+                            async with session.head(url, timeout=aiohttp.ClientTimeout(total=4), allow_redirects=True) as h:
+                                # Only a 2xx answer is evidence; servers that don't route HEAD
+                                # reply 400/403/404/5xx to it, so let the GET decide for those
+                                if not 200 <= h.status < 300:
+                                    self.no_head.add(host)
+                                elif not is_html(h.headers) or (h.content_length or 0) > MAX_HEAD_BYTES:
+                                    return None, True
+                        except Exception:
+                            # Plenty of servers hang on or drop HEAD; judge the host by the GET
+                            self.no_head.add(host)
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=8), allow_redirects=True) as r:
+                        if r.status == 200:
+                            if not is_html(r.headers):
+                                return None, True
+                            body = bytearray()
+                            async for chunk in r.content.iter_chunked(65536):
+                                body += chunk
+                                if len(body) >= MAX_BODY_BYTES:
+                                    break
+                            # get_encoding() needs a body read via read(); fall back to UTF-8 ourselves,
+                            # also for charset names Python does not know (e.g. utf8mb4)
+                            charset = r.charset or 'utf-8'
+                            try:
+                                codecs.lookup(charset)
+                            except LookupError:
+                                charset = 'utf-8'
+                            html = body[:MAX_BODY_BYTES].decode(charset, errors='replace')
+                            return html, True
+                        return None, r.status < 500
+                except asyncio.TimeoutError:
+                    self.host_fail[host] += 1
+                    return None, False
+                except:
+                    return None, False
+
+    async def dns_alive(self, domain):
+        """Resolve one domain on the event loop; any error counts as dead."""
+        async with self.dns_sem:
             try:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=8), allow_redirects=True) as r:
-                    if r.status == 200:
-                        return await r.text(), True
-                    return None, r.status < 500
+                await self.resolver.query_dns(domain, 'A')
+                return True
             except:
-                return None, False
-
-    def extract_domains(self, html, base_url):
-        domains = set()
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            for a in soup.find_all('a', href=True):
-                href = str(a.get('href', ''))
-                full = urljoin(base_url, href)
-                d = self.normalize(full)
-                if d:
-                    domains.add(d)
-            for m in re.finditer(r'https?://([a-zA-Z0-9][-a-zA-Z0-9.]*\.[a-zA-Z]{2,})', str(soup)):
-                domains.add(m.group(1).lower())
-        except:
-            pass
-        return domains
+                return False
 
-    def dns_check_sync(self, domain):
-        """Synchronous DNS check for thread pool."""
-        try:
-            socket.setdefaulttimeout(2)
-            socket.gethostbyname(domain)
-            return domain, True
-        except:
-            return domain, False
+    async def check_site(self, session, domain, source):
+        """Fetch one domain and record it. Returns (domain, title, has_content) or None."""
+        if not self.claim(domain):
+            return None
 
-    async def batch_dns_check(self, domains):
-        """Check many domains in parallel using thread pool."""
-        loop = asyncio.get_event_loop()
-        tasks = [loop.run_in_executor(self.dns_executor, self.dns_check_sync, d) for d in domains]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        alive = []
-        for r in results:
-            if isinstance(r, tuple) and r[1]:
-                alive.append(r[0])
-        return alive
-
-    async def batch_check_sites(self, session, domains, source):
-        """Check multiple domains for real content in parallel."""
-        async def check_one(domain):
-            if domain in self.visited:
-                return None
-            self.visited.add(domain)
+        url = f"https://{domain}"
+        html, alive = await self.fetch(session, url)
 
-            url = f"https://{domain}"
-            html, alive = await self.fetch(session, url)
+        if not alive:
+            return None
 
-            if not alive:
-                return None
+        page = await self.parse(html, url) if html else None
+        has_content = html and not page["is_parked"]
+        title = page["title"] if html else ""
 
-            has_content = html and not self.is_parked(html)
-            title = self.get_title(html) if html else ""
+        is_new = self.db.add(domain, url, source, True, has_content, title)
 
-            is_new = self.db.add(domain, url, source, True, has_content, title)
+        if has_content:
+            if is_new:
+                self.discoveries.append(domain)
+            return (domain, title, True)
+        return (domain, "", False)
 
+    def print_hit(self, result):
+        if isinstance(result, tuple):
+            domain, title, has_content = result
             if has_content:
-                if is_new:
-                    self.discoveries.append(domain)
-                return (domain, title, True)
-            return (domain, "", False)
+                print(f"  ✅ {domain}" + (f" - {title[:40]}" if title else ""))
 
-        tasks = [check_one(d) for d in domains]
+    async def batch_check_sites(self, session, domains, source):
+        """Check multiple domains for real content in parallel."""
+        tasks = [self.check_site(session, d, source) for d in domains]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         for r in results:
-            if isinstance(r, tuple):
-                domain, title, has_content = r
-                status = "✅" if has_content else "⚪"
-                if has_content:
-                    print(f"  {status} {domain}" + (f" - {title[:40]}" if title else ""))
+            self.print_hit(r)
+
+    async def enumerate_candidates(self, session, candidates, dns_workers=200, http_workers=50):
+        """Phase 2 pipeline: DNS workers feed resolving domains straight to HTTP workers."""
+        candidate_q = asyncio.Queue()
+        for d in candidates:
+            candidate_q.put_nowait(d)
+        alive_q = asyncio.Queue(maxsize=1000)
+        resolved = []
+
+        async def dns_worker():
+            while not candidate_q.empty():
+                domain = candidate_q.get_nowait()
+                if await self.dns_alive(domain):
+                    resolved.append(domain)
+                    await alive_q.put(domain)
+
+        async def http_worker():
+            while (domain := await alive_q.get()) is not None:
+                try:
+                    self.print_hit(await self.check_site(session, domain, "bruteforce"))
+                except Exception:
+                    pass
+
+        http_tasks = [asyncio.create_task(http_worker()) for _ in range(http_workers)]
+        try:
+            await asyncio.gather(*(dns_worker() for _ in range(dns_workers)))
+            for _ in http_tasks:
+                await alive_q.put(None)
+            await asyncio.gather(*http_tasks)
+        finally:
+            # On Ctrl+C or an error the sentinels never arrive; don't leave workers parked on the queue
+            for t in http_tasks:
+                t.cancel()
+        return resolved
 
     async def crawl(self, session, url, depth=0):
         domain = self.normalize(url)
-        if not domain or domain in self.visited:
+        if not domain or not self.claim(domain):
             return
-        self.visited.add(domain)
 
         html, alive = await self.fetch(session, url)
 
         has_content = False
         title = ""
         if html:
-            has_content = not self.is_parked(html)
-            title = self.get_title(html)
+            page = await self.parse(html, url, links=depth < 2)
+            has_content = not page["is_parked"]
+            title = page["title"]
 
         status = "✅" if has_content else "⚪" if alive else "❌"
         print(f"  {status} {domain}" + (f" - {title[:40]}" if title and has_content else ""))
@@ -330,7 +607,7 @@ class Crawler:
             self.discoveries.append(domain)
 
         if html and has_content and depth < 2:
-            new_domains = [d for d in self.extract_domains(html, url)
+            new_domains = [d for d in page["domains"]
                           if d not in self.visited and self.is_interesting(d)]
             if new_domains:
                 await self.batch_check_sites(session, new_domains[:20], "link")
@@ -344,13 +621,12 @@ class Crawler:
             return []
 
         # Extract ALL domains from the page
-        domains = self.extract_domains(html, url)
+        domains = (await self.parse(html, url, links=True))["domains"]
 
         # Filter to interesting ones not already known
         new_leads = [d for d in domains
                      if d not in self.visited
-                     and d not in SKIP
-                     and not any(s in d for s in SKIP)]
+                     and _SKIP_RE.search(d) is None]
 
         print(f"    Found {len(new_leads)} potential leads")
 
@@ -366,57 +642,34 @@ class Crawler:
         print("="*60)
         print(f"✅ = real content | ⚪ = parked/empty | ❌ = down")
 
-        ssl_ctx = ssl.create_default_context(cafile=certifi.where())
-        conn = aiohttp.TCPConnector(limit=500, ssl=ssl_ctx, ttl_dns_cache=300)
-
-        async with aiohttp.ClientSession(connector=conn) as session:
-            # Phase 0: Deep scrape lead sources (aggregators)
-            lead_sources = load_lead_sources()
-            if lead_sources:
-                print(f"\n🎯 PHASE 0: SCRAPING {len(lead_sources)} LEAD SOURCES")
-                print("-"*40)
-                for name, info in lead_sources.items():
-                    url = info.get('url', f'https://{name}')
-                    await self.deep_scrape_lead_source(session, url, name)
-
-            # Phase 1: Crawl seeds
-            print(f"\n📡 PHASE 1: CRAWLING {len(SEED_URLS)} SEEDS")
-            print("-"*40)
-            tasks = [self.crawl(session, url, 0) for url in SEED_URLS]
-            await asyncio.gather(*tasks, return_exceptions=True)
+        session = get_session()
 
-            # Phase 2: Generate candidates
-            print(f"\n🔨 PHASE 2: DOMAIN ENUMERATION")
+        # Phase 0: Deep scrape lead sources (aggregators)
+        lead_sources = load_lead_sources()
+        if lead_sources:
+            print(f"\n🎯 PHASE 0: SCRAPING {len(lead_sources)} LEAD SOURCES")
             print("-"*40)
-            candidates = set()
-            for base in BASES:
-                for suffix in SUFFIXES:
-                    for tld in TLDS:
-                        d = f"{base}{suffix}.{tld}"
-                        if d not in self.db.known() and d not in self.visited:
-                            candidates.add(d)
-
-            print(f"  Generated {len(candidates)} candidates")
-            print(f"  Running parallel DNS checks...")
-
-            # Batch DNS check (very fast)
-            candidates_list = list(candidates)
-            batch_size = 500
-            all_alive = []
-
-            for i in range(0, len(candidates_list), batch_size):
-                batch = candidates_list[i:i+batch_size]
-                alive = await self.batch_dns_check(batch)
-                all_alive.extend(alive)
-                print(f"    DNS batch {i//batch_size + 1}: {len(alive)} alive domains")
-
-            print(f"  Found {len(all_alive)} domains with DNS")
-            print(f"  Checking for real content...")
-
-            # Batch HTTP check
-            for i in range(0, len(all_alive), 100):
-                batch = all_alive[i:i+100]
-                await self.batch_check_sites(session, batch, "bruteforce")
+            for name, info in lead_sources.items():
+                url = info.get('url', f'https://{name}')
+                await self.deep_scrape_lead_source(session, url, name)
+
+        # Phase 1: Crawl seeds
+        print(f"\n📡 PHASE 1: CRAWLING {len(SEED_URLS)} SEEDS")
+        print("-"*40)
+        tasks = [self.crawl(session, url, 0) for url in SEED_URLS]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Phase 2: Generate candidates
+        print(f"\n🔨 PHASE 2: DOMAIN ENUMERATION")
+        print("-"*40)
+        known = self.db.known() | self.visited
+        candidates = {f"{b}{s}.{t}" for b, s, t in itertools.product(BASES, SUFFIXES, TLDS)} - known
+
+        print(f"  Generated {len(candidates)} candidates")
+        print(f"  Resolving and checking for real content...")
+
+        all_alive = await self.enumerate_candidates(session, candidates)
+        print(f"  Found {len(all_alive)} domains with DNS")
 
         self.db.save()
 
@@ -429,7 +682,7 @@ class Crawler:
         if self.discoveries:
             print(f"\n✅ NEW REAL SITES:")
             for d in sorted(self.discoveries):
-                info = self.db.data["sites"].get(d, {})
+                info = self.db.get(d)
                 title = info.get("title", "")[:50]
                 print(f"   • https://{d}" + (f" - {title}" if title else ""))
 
@@ -439,7 +692,11 @@ class Crawler:
 async def main():
     db = Database()
     crawler = Crawler(db)
-    await crawler.run()
+    try:
+        await crawler.run()
+    finally:
+        crawler.close()
+        await close_session()
 
 
 if __name__ == "__main__":
@@ -4,9 +4,12 @@ Deduplicate portals with same base name but different TLDs.
 Keeps the highest-quality version of each.
 """
 
-import json
+import itertools
 from pathlib import Path
 from collections import defaultdict
+from functools import lru_cache
+
+from fast_json import load_json, dump_json
 
 PORTALS_JSON = Path(__file__).parent.parent / "portals.json"
 
@@ -50,27 +53,39 @@ KNOWN_DIFFERENT = {
     ('agents.dev', 'agents.space'),
 }
 
+# Longest TLDs first so multi-part suffixes win over their last label
+_TLDS_BY_LEN = tuple(sorted(TLD_PRIORITY, key=len, reverse=True))
 
-def get_base_name(url: str) -> str:
-    """Extract base name from URL (without TLD)."""
-    domain = url.split('//')[1].split('/')[0].replace('www.', '').lower()
-    # Handle multi-part TLDs
-    for tld in sorted(TLD_PRIORITY.keys(), key=len, reverse=True):
+# KNOWN_DIFFERENT lists each pair once; look them up in either order
+_KNOWN_DIFFERENT_PAIRS = frozenset(KNOWN_DIFFERENT | {(b, a) for a, b in KNOWN_DIFFERENT})
+
+
+@lru_cache(maxsize=4096)
+def domain_of(url: str) -> str:
+    """Extract the lowercased domain from URL, without www."""
+    return url.split('//', 1)[1].split('/', 1)[0].removeprefix('www.').lower()
+
+
+@lru_cache(maxsize=4096)
+def split_domain(url: str) -> tuple:
+    """Split URL's domain into (base name, TLD)."""
+    domain = domain_of(url)
+    for tld in _TLDS_BY_LEN:
         if domain.endswith(tld):
-            return domain[:-len(tld)]
+            return domain[:-len(tld)], tld
     # Fallback: split on last dot
-    parts = domain.rsplit('.', 1)
-    return parts[0] if len(parts) > 1 else domain
+    base, dot, tld = domain.rpartition('.')
+    return (base, '.' + tld) if dot else (domain, '')
+
+
+def get_base_name(url: str) -> str:
+    """Extract base name from URL (without TLD)."""
+    return split_domain(url)[0]
 
 
 def get_tld(url: str) -> str:
     """Extract TLD from URL."""
-    domain = url.split('//')[1].split('/')[0].replace('www.', '').lower()
-    for tld in sorted(TLD_PRIORITY.keys(), key=len, reverse=True):
-        if domain.endswith(tld):
-            return tld
-    parts = domain.rsplit('.', 1)
-    return '.' + parts[1] if len(parts) > 1 else ''
+    return split_domain(url)[1]
 
 
 def score_portal(portal: dict) -> int:
@@ -108,16 +123,12 @@ def score_portal(portal: dict) -> int:
 
 def is_known_different(url1: str, url2: str) -> bool:
     """Check if two URLs are known to be different sites."""
-    domain1 = url1.split('//')[1].split('/')[0].replace('www.', '').lower()
-    domain2 = url2.split('//')[1].split('/')[0].replace('www.', '').lower()
-
-    return (domain1, domain2) in KNOWN_DIFFERENT or (domain2, domain1) in KNOWN_DIFFERENT
+    return (domain_of(url1), domain_of(url2)) in _KNOWN_DIFFERENT_PAIRS
 
 
 def find_duplicates():
     """Find and report duplicate portals."""
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
+    data = load_json(PORTALS_JSON)
 
     # Group by base name
     by_base = defaultdict(list)
@@ -134,11 +145,10 @@ def find_duplicates():
 
     for base, portals in sorted(duplicates.items()):
         # Skip if all are known to be different
-        urls = [p['url'] for p in portals]
-        all_different = all(
-            is_known_different(urls[i], urls[j])
-            for i in range(len(urls))
-            for j in range(i+1, len(urls))
+        doms = [domain_of(p['url']) for p in portals]
+        all_different = not any(
+            pair not in _KNOWN_DIFFERENT_PAIRS
+            for pair in itertools.combinations(doms, 2)
         )
         if all_different:
             continue
@@ -183,14 +193,12 @@ def dedupe(dry_run=True):
         print("\nRun with --apply to actually remove them")
         return
 
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
+    data = load_json(PORTALS_JSON)
 
     remove_urls = {p['url'] for p in to_remove}
     data['portals'] = [p for p in data['portals'] if p['url'] not in remove_urls]
 
-    with open(PORTALS_JSON, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    dump_json(PORTALS_JSON, data)
 
     print(f"✅ Removed {len(to_remove)} duplicates")
     print(f"📁 Remaining: {len(data['portals'])} portals")
@@ -15,7 +15,6 @@ Usage:
 
 import asyncio
 import sys
-import json
 from pathlib import Path
 from urllib.parse import urlparse
 from collections import Counter
@@ -23,7 +22,8 @@ from collections import Counter
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from crawler import Database, Crawler, SEED_URLS
+from crawler import Database, Crawler, SEED_URLS, close_session
+from fast_json import load_json, dump_json
 from sync_portals import sync
 
 PORTALS_JSON = Path(__file__).parent.parent / "portals.json"
@@ -33,14 +33,17 @@ async def run_crawler(fast_mode: bool = False):
     """Run the crawler."""
     db = Database()
     crawler = Crawler(db)
-    await crawler.run()
+    try:
+        await crawler.run()
+    finally:
+        crawler.close()
+        await close_session()
     return len(crawler.discoveries)
 
 
 def check_duplicates() -> list:
     """Check for duplicate URLs in portals.json."""
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
+    data = load_json(PORTALS_JSON)
 
     # Normalize URLs for comparison
     url_to_portals = {}
@@ -77,8 +80,7 @@ def remove_duplicates(dry_run: bool = True) -> int:
 
     print(f"🔍 Found {len(duplicates)} duplicate URL groups:\n")
 
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
+    data = load_json(PORTALS_JSON)
 
     to_remove = []
     for dup in duplicates:
@@ -101,8 +103,7 @@ def remove_duplicates(dry_run: bool = True) -> int:
     # Actually remove
     data['portals'] = [p for p in data['portals'] if p['id'] not in to_remove]
 
-    with open(PORTALS_JSON, 'w') as f:
-        json.dump(data, f, indent=2)
+    dump_json(PORTALS_JSON, data)
 
     print(f"✅ Removed {len(to_remove)} duplicate entries")
     return len(to_remove)
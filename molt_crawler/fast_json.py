@@ -0,0 +1,46 @@
+"""
+JSON file helpers shared by the crawler scripts.
+Uses orjson when it is installed and falls back to the stdlib json module.
+Both paths write the same bytes: 2-space indent, UTF-8, no ASCII escaping.
+Read-only scans can stream a top-level list with ijson when it is installed.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def load_json(path):
+    """Parse a JSON file."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(path, obj):
+    """Write obj to path as indented JSON."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def iter_json_items(path, key):
+    """Yield the items of the top-level list obj[key] without loading the whole file."""
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, f'{key}.item', use_float=True)
+        return
+    yield from load_json(path)[key]
@@ -6,28 +6,32 @@ Keeps skill.md in sync with the skills registry automatically.
 Run manually or via pre-commit hook.
 """
 
-import json
+from collections import Counter, defaultdict
 from pathlib import Path
 from datetime import datetime
 
+from fast_json import load_json
+
 SKILLS_JSON = Path(__file__).parent.parent / "skills.json"
 SKILL_MD = Path(__file__).parent.parent / "skill.md"
 
+# Section order in skill.md
+CATEGORIES = ('social', 'creative', 'platform', 'gaming')
+
 
 def load_skills():
     """Load the skills registry."""
-    with open(SKILLS_JSON) as f:
-        return json.load(f)
+    return load_json(SKILLS_JSON)
 
 
-def generate_skills_table(skills, category):
-    """Generate markdown table for a category."""
-    filtered = [s for s in skills if s["category"] == category]
+def generate_skills_table(by_category, category):
+    """Generate markdown table for a category from skills grouped by category."""
+    filtered = by_category.get(category)
     if not filtered:
         return ""
 
     # Sort by upvotes descending
-    filtered.sort(key=lambda s: s.get("upvotes", 0), reverse=True)
+    filtered = sorted(filtered, key=lambda s: s.get("upvotes", 0), reverse=True)
 
     lines = ["| Skill | Platform | Description |", "|-------|----------|-------------|"]
     for s in filtered:
@@ -56,13 +60,12 @@ def generate_markdown(data):
     total = len(skills)
     updated = data.get("updated", datetime.now().strftime("%Y-%m-%d"))
 
-    # Count by category
-    categories = {}
+    # Group by category in one pass
+    by_category = defaultdict(list)
     for s in skills:
-        cat = s["category"]
-        categories[cat] = categories.get(cat, 0) + 1
+        by_category[s["category"]].append(s)
 
-    md = f"""# MoltStudio Skill Registry
+    parts = [f"""# MoltStudio Skill Registry
 
 > Discover skills for AI agents. The Product Hunt of the agent internet.
 
@@ -128,19 +131,14 @@ curl https://molt-place.com/skill.md
 
 ## Available Skills ({total})
 
-### Social ({categories.get('social', 0)})
-{generate_skills_table(skills, 'social')}
-
-### Creative ({categories.get('creative', 0)})
-{generate_skills_table(skills, 'creative')}
+"""]
 
-### Platform ({categories.get('platform', 0)})
-{generate_skills_table(skills, 'platform')}
+    for cat in CATEGORIES:
+        parts.append(f"### {cat.title()} ({len(by_category.get(cat, ()))})\n")
+        parts.append(generate_skills_table(by_category, cat))
+        parts.append("\n\n")
 
-### Gaming ({categories.get('gaming', 0)})
-{generate_skills_table(skills, 'gaming')}
-
-## Collections
+    parts.append(f"""## Collections
 
 Pre-bundled skill sets for common use cases:
 
@@ -206,8 +204,8 @@ Built by the Molt community | [moltstudio.xyz](https://moltstudio.xyz) | [GitHub
   Run: python3 molt_crawler/generate_skill_md.py
   Do not edit manually - changes will be overwritten
 -->
-"""
-    return md
+""")
+    return "".join(parts)
 
 
 def main():
@@ -220,11 +218,10 @@ def main():
     with open(SKILL_MD, 'w') as f:
         f.write(md)
 
+    counts = Counter(s['category'] for s in data['skills'])
     print(f"✅ Generated skill.md with {len(data['skills'])} skills")
-    print(f"   - Social: {len([s for s in data['skills'] if s['category'] == 'social'])}")
-    print(f"   - Creative: {len([s for s in data['skills'] if s['category'] == 'creative'])}")
-    print(f"   - Platform: {len([s for s in data['skills'] if s['category'] == 'platform'])}")
-    print(f"   - Gaming: {len([s for s in data['skills'] if s['category'] == 'gaming'])}")
+    for cat in CATEGORIES:
+        print(f"   - {cat.title()}: {counts[cat]}")
 
 
 if __name__ == "__main__":
@@ -5,16 +5,29 @@ Adds relevance scores, trust levels, and status tracking.
 Now uses JSON files for exclusions instead of hardcoded lists.
 """
 
+import atexit
 import json
 import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlsplit
 from datetime import datetime, timedelta
 
+from fast_json import load_json, dump_json, iter_json_items
+
+import ahocorasick
+
 # File paths
 PORTALS_JSON = Path(__file__).parent.parent / "portals.json"
 EXCLUDED_JSON = Path(__file__).parent / "excluded_sites.json"
 AUDIT_LOG_JSON = Path(__file__).parent / "audit_log.json"
 
+# Below this many portals, process startup costs more than scoring serially
+PARALLEL_MIN_PORTALS = 2000
+
 # Relevance keywords - higher weight = more relevant
 RELEVANCE_KEYWORDS = {
     # Core molt ecosystem (weight 3)
@@ -30,6 +43,10 @@ RELEVANCE_KEYWORDS = {
     'agent social': 2, 'agent marketplace': 2,
 }
 
+# Domains containing any of these are treated as molt ecosystem sites
+MOLT_DOMAIN_KEYWORDS = ('molt', 'claw', 'lobster', 'craber')
+_MOLT_DOMAIN_RE = re.compile('|'.join(map(re.escape, MOLT_DOMAIN_KEYWORDS)))
+
 # Auto-detection patterns for bad sites
 # Key principle: We want sites USABLE BY agents, not sites ABOUT agents or FOR humans
 AUTO_DETECT_BAD = {
@@ -110,6 +127,76 @@ RED_FLAGS = [
     'hostinger dns system', 'future home of',
 ]
 
+
+def _build_automaton(entries):
+    """Compile (phrase, value) pairs into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for phrase, value in entries:
+        if phrase not in automaton:  # keep the first value given for a phrase
+            automaton.add_word(phrase, value)
+    automaton.make_automaton()
+    return automaton
+
+
+def _phrase_entries():
+    """(phrase, (bad, is_red_flag, length)) for every AUTO_DETECT_BAD pattern and RED_FLAGS phrase."""
+    phrases = {}
+    # bad is (priority, category, pattern); the lowest priority hit is the one the
+    # dict-order loop would have reported first
+    for i, (category, pattern) in enumerate(
+            (c, p) for c, patterns in AUTO_DETECT_BAD.items() for p in patterns):
+        phrases.setdefault(pattern, [(i, category, pattern), False])
+    for flag in RED_FLAGS:
+        phrases.setdefault(flag, [None, False])[1] = True
+    return ((phrase, (bad, red, len(phrase))) for phrase, (bad, red) in phrases.items())
+
+
+# Bad-site patterns and red flags share most phrases, so one automaton tags both
+_PHRASE_AUTOMATON = _build_automaton(_phrase_entries())
+_KEYWORD_AUTOMATON = _build_automaton((kw, (i, kw)) for i, kw in enumerate(RELEVANCE_KEYWORDS))
+
+
+def find_bad_pattern(text: str, start: int = 0, end: int = None) -> tuple:
+    """Return (category, pattern) of the first AUTO_DETECT_BAD match in text[start:end], or None."""
+    if end is None:
+        end = len(text)
+    best = min((bad for _, (bad, _, _) in _PHRASE_AUTOMATON.iter(text, start, end) if bad),
+               default=None)
+    return best[1:] if best else None
+
+
+def has_red_flag(text: str) -> bool:
+    """Check text for any RED_FLAGS phrase in a single pass."""
+    for _, (_, red, _) in _PHRASE_AUTOMATON.iter(text):
+        if red:
+            return True
+    return False
+
+
+def scan_phrases(text: str, start: int, end: int) -> tuple:
+    """
+    One pass for find_bad_pattern(text, start, end) and has_red_flag(text).
+    Returns (bad_match, has_red_flag).
+    """
+    best = None
+    red_flag = False
+    for last, (bad, red, length) in _PHRASE_AUTOMATON.iter(text):
+        red_flag = red_flag or red
+        # Bad-site patterns only count inside text[start:end]
+        if bad and last < end and last - length + 1 >= start and (best is None or bad < best):
+            best = bad
+    return (best[1:] if best else None, red_flag)
+
+
+def find_keywords(text: str, start: int = 0, end: int = None) -> list:
+    """Return the RELEVANCE_KEYWORDS found in text[start:end], in dict order."""
+    if end is None:
+        end = len(text)
+    # Overlapping hits matter ('moltbook' also scores 'molt'), which rules out a regex alternation
+    # Sorting the distinct hits by dict index only touches keywords that matched
+    return [kw for _, kw in sorted({hit for _, hit in _KEYWORD_AUTOMATON.iter(text, start, end)})]
+
+
 # Quality categories
 TRUST_LEVELS = {
     'verified': 'Manually verified, trusted',
@@ -119,26 +206,70 @@ TRUST_LEVELS = {
     'untrusted': 'Known issues or security concerns',
 }
 
+# Trust levels from least to most trusted
+_TRUST_IDX = {t: i for i, t in enumerate(['untrusted', 'low', 'medium', 'high', 'verified'])}
+# Trust levels that get flagged for review
+LOW_TRUST = frozenset({'low', 'untrusted'})
+
 # Status values
-STATUS_VALUES = ['active', 'inactive', 'down', 'compromised', 'parked']
+STATUS_VALUES = frozenset({'active', 'inactive', 'down', 'compromised', 'parked'})
+
+
+# Parsed excluded_sites.json, refreshed only when the file's mtime changes
+_EXCLUDED_CACHE = {'mtime': None, 'excluded': {}, 'lead_sources': {}, 'trie': {}}
+
+# Marks the end of an excluded domain in the reversed-label trie
+_TRIE_END = None
+
+
+def _load_excluded_cache() -> dict:
+    """Return _EXCLUDED_CACHE, re-reading excluded_sites.json if it changed on disk."""
+    try:
+        mtime = EXCLUDED_JSON.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+    if mtime != _EXCLUDED_CACHE['mtime']:
+        data = load_json(EXCLUDED_JSON) if mtime is not None else {}
+        _EXCLUDED_CACHE['excluded'] = data.get('excluded', {})
+        _EXCLUDED_CACHE['lead_sources'] = data.get('lead_sources', {})
+        _EXCLUDED_CACHE['trie'] = build_domain_trie(_EXCLUDED_CACHE['excluded'])
+        _EXCLUDED_CACHE['mtime'] = mtime
+    return _EXCLUDED_CACHE
 
 
 def load_excluded_domains() -> dict:
     """Load excluded domains from JSON file."""
-    if EXCLUDED_JSON.exists():
-        with open(EXCLUDED_JSON) as f:
-            data = json.load(f)
-            return data.get('excluded', {})
-    return {}
+    # Copy so callers can edit it without touching the cache
+    return dict(_load_excluded_cache()['excluded'])
+
+
+def build_domain_trie(domains) -> dict:
+    """Build a nested-dict trie keyed by domain labels, right to left."""
+    root = {}
+    for domain in domains:
+        node = root
+        for label in reversed(domain.lower().split('.')):
+            # Interned so repeated labels ('com', 'io', ...) share one object
+            node = node.setdefault(sys.intern(label), {})
+        node[_TRIE_END] = True
+    return root
+
+
+def is_excluded_domain(domain: str) -> bool:
+    """Check if domain or any parent domain is in the exclusion list."""
+    node = _load_excluded_cache()['trie']
+    for label in reversed(domain.split('.')):
+        node = node.get(label)
+        if node is None:
+            return False
+        if _TRIE_END in node:
+            return True
+    return False
 
 
 def load_lead_sources() -> dict:
     """Load aggregator sites that can be scraped for new leads."""
-    if EXCLUDED_JSON.exists():
-        with open(EXCLUDED_JSON) as f:
-            data = json.load(f)
-            return data.get('lead_sources', {})
-    return {}
+    return dict(_load_excluded_cache()['lead_sources'])
 
 
 def save_excluded_domains(excluded: dict):
@@ -147,18 +278,41 @@ def save_excluded_domains(excluded: dict):
         'excluded': excluded,
         'updated': datetime.now().strftime('%Y-%m-%d')
     }
-    with open(EXCLUDED_JSON, 'w') as f:
-        json.dump(data, f, indent=2)
+    dump_json(EXCLUDED_JSON, data)
 
+    # Force a re-read even if the write landed within the mtime resolution
+    _EXCLUDED_CACHE['mtime'] = None
+
+    # Cached verdicts may depend on the old exclusion list
+    is_false_positive.cache_clear()
+    _score_one.cache_clear()
+
+
+_audit_flush_registered = False
+
+
+def _flush_audit():
+    """Fold entries appended to audit_log.jsonl into audit_log.json."""
+    pending = AUDIT_LOG_JSON.with_suffix('.jsonl')
+    if not pending.exists():
+        return
 
-def log_audit(action: str, site: str = None, reason: str = None, count: int = None):
-    """Log an audit action."""
     if AUDIT_LOG_JSON.exists():
-        with open(AUDIT_LOG_JSON) as f:
-            data = json.load(f)
+        data = load_json(AUDIT_LOG_JSON)
     else:
         data = {'log': []}
 
+    with open(pending, encoding='utf-8') as f:
+        data['log'].extend(json.loads(line) for line in f if line.strip())
+
+    dump_json(AUDIT_LOG_JSON, data)
+    pending.unlink()
+
+
+def log_audit(action: str, site: str = None, reason: str = None, count: int = None):
+    """Log an audit action."""
+    global _audit_flush_registered
+
     entry = {
         'date': datetime.now().strftime('%Y-%m-%d %H:%M'),
         'action': action,
@@ -170,10 +324,13 @@ def log_audit(action: str, site: str = None, reason: str = None, count: int = No
     if count is not None:
         entry['count'] = count
 
-    data['log'].append(entry)
+    # Append one line now; the JSON log is rewritten once at exit
+    with open(AUDIT_LOG_JSON.with_suffix('.jsonl'), 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
 
-    with open(AUDIT_LOG_JSON, 'w') as f:
-        json.dump(data, f, indent=2)
+    if not _audit_flush_registered:
+        atexit.register(_flush_audit)
+        _audit_flush_registered = True
 
 
 def exclude_site(domain: str, reason: str, category: str = 'other'):
@@ -192,68 +349,91 @@ def exclude_site(domain: str, reason: str, category: str = 'other'):
     print(f"  ❌ Excluded: {domain} ({reason})")
 
 
+def _detect_bad(domain_lower: str, desc_lower: str, description: str, match: tuple) -> tuple:
+    """auto_detect_bad_site on lowercased fields, given find_bad_pattern's result."""
+    if match:
+        category, pattern = match
+        return (True, category, f"Auto-detected: '{pattern}'")
+
+    # Check for minimal content (description is just domain or very short)
+    if desc_lower.strip() == domain_lower.strip():
+        return (True, 'minimal_content', 'Description same as domain')
+
+    if len(description) < 15 and 'molt' not in domain_lower and 'claw' not in domain_lower:
+        return (True, 'minimal_content', 'Very short description, not molt domain')
+
+    return (False, None, None)
+
+
 def auto_detect_bad_site(domain: str, title: str, description: str) -> tuple:
     """
     Automatically detect if a site is bad based on content patterns.
     Returns (is_bad, category, reason) tuple.
     """
-    text = f"{title} {description}".lower()
+    desc_lower = description.lower()
+    match = find_bad_pattern(f"{title.lower()} {desc_lower}")
+    return _detect_bad(domain.lower(), desc_lower, description, match)
 
-    for category, patterns in AUTO_DETECT_BAD.items():
-        for pattern in patterns:
-            if pattern in text:
-                return (True, category, f"Auto-detected: '{pattern}'")
 
-    # Check for minimal content (description is just domain or very short)
-    if description.lower().strip() == domain.lower().strip():
-        return (True, 'minimal_content', 'Description same as domain')
-
-    if len(description) < 15 and 'molt' not in domain.lower() and 'claw' not in domain.lower():
-        return (True, 'minimal_content', 'Very short description, not molt domain')
+def _blocked_domain(domain_lower: str) -> bool:
+    """Domain-only false positive checks; domain_lower has 'www.' removed."""
+    # Check for mailto: or invalid URLs
+    if domain_lower.startswith('mailto:'):
+        return True
 
-    return (False, None, None)
+    # Check excluded domains (and their subdomains) from JSON
+    return is_excluded_domain(domain_lower)
 
 
+@lru_cache(maxsize=8192)
 def is_false_positive(domain: str, title: str, description: str) -> bool:
     """Check if site matches false positive patterns."""
-    text = f"{title} {description}".lower()
     domain_lower = domain.lower().replace('www.', '')
 
-    # Check excluded domains from JSON
-    excluded = load_excluded_domains()
-    if domain_lower in excluded:
-        return True
-
-    # Check for mailto: or invalid URLs
-    if domain_lower.startswith('mailto:'):
+    # Cheap domain checks first; only then scan the text
+    if _blocked_domain(domain_lower):
         return True
 
     # Auto-detect bad sites
-    is_bad, category, reason = auto_detect_bad_site(domain_lower, title, description)
-    if is_bad:
-        return True
+    desc_lower = description.lower()
+    match = find_bad_pattern(f"{title.lower()} {desc_lower}")
+    return _detect_bad(domain_lower, desc_lower, description, match)[0]
 
-    return False
 
+@lru_cache(maxsize=8192)
+def _score_one(domain: str, title: str, description: str, notes: str = "") -> tuple:
+    """
+    Score one portal in a single pass, lowercasing each field once.
+    Returns (relevance, keywords, trust); keywords is a tuple.
+    """
+    domain_lower = domain.lower()
+    fp_domain = domain_lower.replace('www.', '')
 
-def calculate_relevance(domain: str, title: str, description: str) -> tuple:
-    """Calculate relevance score 0-100 based on molt ecosystem keywords."""
-    # First check if it's a false positive
-    if is_false_positive(domain, title, description):
-        return (0, ['FALSE_POSITIVE'])
+    # False positives are always untrusted with zero relevance; the domain-only
+    # checks need no text, so they run before anything is scanned
+    if _blocked_domain(fp_domain):
+        return (0, ('FALSE_POSITIVE',), 'untrusted')
 
-    text = f"{domain} {title} {description}".lower()
-    score = 0
-    matches = []
+    title_lower = title.lower()
+    desc_lower = description.lower()
 
-    for keyword, weight in RELEVANCE_KEYWORDS.items():
-        if keyword in text:
-            score += weight * 10
-            matches.append(keyword)
+    # One lowercased string serves every scan: text[start:end] is 'title description'
+    # for the bad-site check, text[:end] adds the domain for keywords, and the whole
+    # string (notes included) is checked for red flags
+    text = f"{domain_lower} {title_lower} {desc_lower} {notes.lower()}"
+    start = len(domain_lower) + 1
+    end = start + len(title_lower) + 1 + len(desc_lower)
+
+    match, red_flag = scan_phrases(text, start, end)
+    if _detect_bad(fp_domain, desc_lower, description, match)[0]:
+        return (0, ('FALSE_POSITIVE',), 'untrusted')
+
+    # Relevance based on molt ecosystem keywords
+    matches = tuple(find_keywords(text, 0, end))
+    score = sum(map(RELEVANCE_KEYWORDS.__getitem__, matches)) * 10
 
     # Bonus for domain containing core molt/claw keywords (these are ecosystem sites)
-    domain_lower = domain.lower()
-    is_molt_domain = any(k in domain_lower for k in ['molt', 'claw', 'lobster', 'craber'])
+    is_molt_domain = _MOLT_DOMAIN_RE.search(domain_lower) is not None
 
     if is_molt_domain:
         score += 30  # Strong bonus for molt ecosystem domains
@@ -267,7 +447,7 @@ def calculate_relevance(domain: str, title: str, description: str) -> tuple:
         score = max(0, score - (10 if is_molt_domain else 20))
 
     # Penalty for descriptions that are just the domain name
-    if description.lower().strip() == domain_lower.strip():
+    if desc_lower.strip() == domain_lower.strip():
         score = max(0, score - (15 if is_molt_domain else 30))
 
     # Penalty for very short/generic descriptions (but less for molt domains)
@@ -275,64 +455,75 @@ def calculate_relevance(domain: str, title: str, description: str) -> tuple:
         score = max(0, score - (5 if is_molt_domain else 10))
 
     # Cap at 100
-    return (min(100, score), matches)
+    relevance = min(100, score)
 
+    # Red flags (notes included) make a site untrusted regardless of relevance
+    if red_flag:
+        trust = 'untrusted'
+    elif relevance >= 60:
+        trust = 'high'
+    elif relevance >= 30:
+        trust = 'medium'
+    else:
+        trust = 'low'
 
-def calculate_trust(domain: str, title: str, description: str, notes: str = "") -> str:
-    """Determine trust level based on content and flags."""
-    text = f"{domain} {title} {description} {notes}".lower()
+    return (relevance, matches, trust)
 
-    # Check if it's a false positive - always untrusted
-    if is_false_positive(domain, title, description):
-        return 'untrusted'
 
-    # Check for red flags
-    for flag in RED_FLAGS:
-        if flag in text:
-            return 'untrusted'
+def calculate_relevance(domain: str, title: str, description: str) -> tuple:
+    """Calculate relevance score 0-100 based on molt ecosystem keywords."""
+    relevance, matches, _ = _score_one(domain, title, description)
+    return (relevance, list(matches))
 
-    # Check relevance
-    relevance, matches = calculate_relevance(domain, title, description)
 
-    # If marked as false positive
-    if 'FALSE_POSITIVE' in matches:
-        return 'untrusted'
+def calculate_trust(domain: str, title: str, description: str, notes: str = "") -> str:
+    """Determine trust level based on content and flags."""
+    return _score_one(domain, title, description, notes)[2]
 
-    if relevance >= 60:
-        return 'high'
-    elif relevance >= 30:
-        return 'medium'
-    else:
-        return 'low'
+
+@lru_cache(maxsize=4096)
+def _domain(url: str) -> str:
+    """Lowercased host of a portal URL (no scheme, port or path)."""
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        host = None
+    if host:
+        return host
+    # Scheme-less or malformed URLs: keep everything before the first slash
+    return url.removeprefix('https://').removeprefix('http://').partition('/')[0].lower()
 
 
-def score_portals():
-    """Add quality scores to all portals."""
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
+def score_portals(data: dict = None, save: bool = True) -> dict:
+    """Add quality scores to all portals; returns the scored portals.json data."""
+    if data is None:
+        data = load_json(PORTALS_JSON)
 
     print("🔍 Scoring portals for quality...\n")
 
     stats = {'high': 0, 'medium': 0, 'low': 0, 'untrusted': 0, 'verified': 0}
     false_positives = []
 
-    for portal in data['portals']:
-        domain = portal.get('url', '').replace('https://', '').replace('http://', '').split('/')[0]
-        title = portal.get('name', '')
-        description = portal.get('description', '')
-        notes = portal.get('notes', '')
-
-        # Calculate scores
-        relevance, keywords = calculate_relevance(domain, title, description)
+    portals = data['portals']
+    domains = [_domain(portal.get('url', '')) for portal in portals]
+    args = (domains,
+            [portal.get('name', '') for portal in portals],
+            [portal.get('description', '') for portal in portals],
+            [portal.get('notes', '') for portal in portals])
+
+    # Calculate scores
+    if len(portals) >= PARALLEL_MIN_PORTALS:
+        with ProcessPoolExecutor() as ex:
+            results = list(ex.map(_score_one, *args, chunksize=256))
+    else:
+        results = list(map(_score_one, *args))
 
+    for portal, domain, (relevance, keywords, trust) in zip(portals, domains, results):
         # Check if already has manual trust override
         if portal.get('verified'):
             trust = 'verified'
         elif 'FALSE_POSITIVE' in keywords:
-            trust = 'untrusted'
             false_positives.append(domain)
-        else:
-            trust = calculate_trust(domain, title, description, notes)
 
         # Update portal
         portal['relevance'] = relevance
@@ -341,13 +532,13 @@ def score_portals():
         stats[trust] = stats.get(trust, 0) + 1
 
         # Show low quality for review
-        if trust in ['low', 'untrusted']:
+        if trust in LOW_TRUST:
             reason = 'FALSE_POSITIVE' if 'FALSE_POSITIVE' in keywords else ''
             print(f"  ⚠️  {domain}: trust={trust}, relevance={relevance} {reason}")
 
     # Save
-    with open(PORTALS_JSON, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if save:
+        dump_json(PORTALS_JSON, data)
 
     print(f"\n📊 Quality Distribution:")
     print(f"  ✅ Verified: {stats.get('verified', 0)}")
@@ -363,18 +554,19 @@ def score_portals():
         if len(false_positives) > 10:
             print(f"    ... and {len(false_positives) - 10} more")
 
+    return data
+
 
 def cleanup_false_positives():
     """Remove known false positive sites from portals.json."""
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
+    data = load_json(PORTALS_JSON)
 
     removed = []
 
     # Filter out false positives
     cleaned_portals = []
     for portal in data['portals']:
-        domain = portal.get('url', '').replace('https://', '').replace('http://', '').split('/')[0].replace('www.', '')
+        domain = _domain(portal.get('url', '')).replace('www.', '')
         title = portal.get('name', '')
         description = portal.get('description', '')
 
@@ -386,8 +578,7 @@ def cleanup_false_positives():
     data['portals'] = cleaned_portals
 
     # Save
-    with open(PORTALS_JSON, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    dump_json(PORTALS_JSON, data)
 
     print(f"🧹 Cleanup complete:")
     print(f"   Removed: {len(removed)} false positives")
@@ -441,17 +632,13 @@ def needs_recheck():
 
 def filter_quality(min_trust: str = 'medium', min_relevance: int = 30):
     """Get only quality portals meeting minimum thresholds."""
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
-
-    trust_order = ['untrusted', 'low', 'medium', 'high', 'verified']
-    min_trust_idx = trust_order.index(min_trust)
+    min_trust_idx = _TRUST_IDX[min_trust]
 
     quality_portals = []
-    for portal in data['portals']:
+    for portal in iter_json_items(PORTALS_JSON, 'portals'):
         trust = portal.get('trust', 'low')
         relevance = portal.get('relevance', 0)
-        trust_idx = trust_order.index(trust) if trust in trust_order else 0
+        trust_idx = _TRUST_IDX.get(trust, 0)
 
         if trust_idx >= min_trust_idx and relevance >= min_relevance:
             quality_portals.append(portal)
@@ -459,10 +646,10 @@ def filter_quality(min_trust: str = 'medium', min_relevance: int = 30):
     return quality_portals
 
 
-def mark_featured():
+def mark_featured(data: dict = None):
     """Automatically mark high-quality portals as featured."""
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
+    if data is None:
+        data = load_json(PORTALS_JSON)
 
     # Featured = verified OR (high trust AND relevance >= 60)
     featured_count = 0
@@ -473,29 +660,24 @@ def mark_featured():
                 featured_count += 1
                 print(f"  ⭐ Featured: {portal.get('name')}")
 
-    with open(PORTALS_JSON, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    dump_json(PORTALS_JSON, data)
 
     print(f"\n✅ Marked {featured_count} new portals as featured")
 
 
 def audit_low_quality():
     """Show all low/untrusted sites for manual review."""
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
-
-    low_quality = [p for p in data['portals'] if p.get('trust') in ['low', 'untrusted']]
+    low_quality = [p for p in iter_json_items(PORTALS_JSON, 'portals') if p.get('trust') in LOW_TRUST]
 
     print(f"🔍 AUDIT: {len(low_quality)} sites need review\n")
     print("-" * 60)
 
-    for p in sorted(low_quality, key=lambda x: x.get('relevance', 0)):
-        domain = p['url'].replace('https://', '').replace('http://', '').split('/')[0]
-        trust = p.get('trust', 'unknown')
-        relevance = p.get('relevance', 0)
-        print(f"{trust:10} | rel:{relevance:3} | {domain}")
-        print(f"           | {p.get('description', '')[:50]}")
-        print()
+    # Build the whole listing and write it once rather than three prints per site
+    print(''.join(
+        f"{p.get('trust', 'unknown'):10} | rel:{p.get('relevance', 0):3} | {_domain(p.get('url', ''))}\n"
+        f"           | {p.get('description', '')[:50]}\n\n"
+        for p in sorted(low_quality, key=lambda x: x.get('relevance', 0))
+    ), end='')
 
     print("-" * 60)
     print("To upgrade a site, edit portals.json and set:")
@@ -506,43 +688,31 @@ def show_stats():
     """Show overall statistics."""
     excluded = load_excluded_domains()
 
-    with open(PORTALS_JSON) as f:
-        data = json.load(f)
-
-    portals = data['portals']
+    # Trust distribution, counted while streaming portals.json
+    by_trust = Counter(p.get('trust', 'unknown') for p in iter_json_items(PORTALS_JSON, 'portals'))
 
     print("📊 MOLT ECOSYSTEM STATS\n")
-    print(f"Total portals: {len(portals)}")
+    print(f"Total portals: {sum(by_trust.values())}")
     print(f"Excluded sites: {len(excluded)}")
 
-    # Trust distribution
-    by_trust = {}
-    for p in portals:
-        t = p.get('trust', 'unknown')
-        by_trust[t] = by_trust.get(t, 0) + 1
-
     print(f"\nTrust Distribution:")
     for t in ['verified', 'high', 'medium', 'low', 'untrusted']:
-        print(f"  {t:12}: {by_trust.get(t, 0)}")
+        print(f"  {t:12}: {by_trust[t]}")
 
     # Exclusion categories
-    by_cat = {}
-    for domain, info in excluded.items():
-        cat = info.get('category', 'other')
-        by_cat[cat] = by_cat.get(cat, 0) + 1
+    by_cat = Counter(info.get('category', 'other') for info in excluded.values())
 
     print(f"\nExclusion Categories:")
-    for cat, count in sorted(by_cat.items(), key=lambda x: -x[1]):
+    for cat, count in by_cat.most_common():
         print(f"  {cat:20}: {count}")
 
 
 if __name__ == "__main__":
-    import sys
     if len(sys.argv) > 1:
         cmd = sys.argv[1]
         if cmd == '--featured':
-            score_portals()
-            mark_featured()
+            # Score in memory and let mark_featured write portals.json once
+            mark_featured(score_portals(save=False))
         elif cmd == '--audit':
             audit_low_quality()
         elif cmd == '--cleanup':
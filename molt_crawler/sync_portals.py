@@ -4,10 +4,11 @@ Sync crawler discoveries to portals.json
 Merges new sites from molt_sites_db.json into the website's portals.json
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 
+from fast_json import load_json, dump_json
+
 # Paths
 CRAWLER_DB = Path(__file__).parent / "molt_sites_db.json"
 PORTALS_JSON = Path(__file__).parent.parent / "portals.json"
@@ -109,8 +110,7 @@ def load_crawler_db() -> dict:
         print(f"Crawler DB not found: {CRAWLER_DB}")
         return {}
 
-    with open(CRAWLER_DB) as f:
-        return json.load(f)
+    return load_json(CRAWLER_DB)
 
 
 def load_portals() -> dict:
@@ -118,8 +118,7 @@ def load_portals() -> dict:
     if not PORTALS_JSON.exists():
         return {"updated": "", "portals": [], "categories": []}
 
-    with open(PORTALS_JSON) as f:
-        return json.load(f)
+    return load_json(PORTALS_JSON)
 
 
 def sync():
@@ -209,8 +208,7 @@ def sync():
         ]
 
     # Save
-    with open(PORTALS_JSON, 'w') as f:
-        json.dump(portals_data, f, indent=2)
+    dump_json(PORTALS_JSON, portals_data)
 
     print(f"\n✅ Added {len(new_portals)} new portals")
     print(f"📁 Total portals: {len(portals_data['portals'])}")